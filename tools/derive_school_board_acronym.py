@@ -1,6 +1,9 @@
 import json
 import re
-from urllib.parse import urlparse
+
+# Leading scheme and common host prefixes, e.g. "http://www." or "school."
+_PREFIX_RE = re.compile(r"^(?:https?://)?(?:www\.|school\.)?")
+_SPLIT_RE = re.compile(r"[.\-/]")
 
 # Load the existing JSON
 with open("../data/20251030_school_boards.json", "r", encoding="utf-8") as f:
@@ -25,10 +28,9 @@ fields.insert(insert_index, {
 for record in records:
     website = record[-1]
     if website:
-        domain = urlparse(website).netloc.lower()
-        # Strip common prefixes/suffixes
-        domain = re.sub(r"^(www\.|school\.|.*//)", "", domain)
-        acronym = re.split(r"[.\-]", domain)[0].upper()
+        # Strip common prefixes, then keep the first domain label
+        domain = _PREFIX_RE.sub("", website.lower())
+        acronym = _SPLIT_RE.split(domain, maxsplit=1)[0].upper()
     else:
         acronym = None
     record.insert(insert_index, acronym)